@@ -4,6 +4,7 @@ Draw.io XML生成模块
 负责生成draw.io格式的机柜部署图XML文件。
 """
 
+import re
 import xml.etree.ElementTree as ET
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
@@ -15,6 +16,9 @@ from .models import Layout, Cabinet, Device
 from .config import DiagramConfig, DEFAULT_DIAGRAM_CONFIG
 from .utils import ensure_directory, create_output_filename
 
+# 机柜编号中的行标识前缀，例如 A01 -> A
+_ROW_ID_PATTERN = re.compile(r'^([A-Za-z]+)')
+
 
 class DrawioGenerator:
     """Draw.io XML生成器类"""
@@ -223,14 +227,13 @@ class DrawioGenerator:
             按行分组的机柜字典，键为行标识（如A、B、C），值为该行的机柜列表
         """
         from collections import defaultdict
-        import re
 
         rows = defaultdict(list)
 
         for cabinet in cabinets:
             # 从机柜编号中提取行标识
             # 例如：A01 -> A, B02 -> B, C03 -> C
-            match = re.match(r'^([A-Za-z]+)', cabinet.机柜)
+            match = _ROW_ID_PATTERN.match(cabinet.机柜)
             if match:
                 row_id = match.group(1).upper()
                 rows[row_id].append(cabinet)
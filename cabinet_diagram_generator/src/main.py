@@ -396,7 +396,12 @@ def select_csv_file() -> Optional[str]:
     # 检查input目录
     input_dir = Path("input")
     if input_dir.exists():
-        csv_files = list(input_dir.glob("*.csv"))
+        # os.scandir 在读取目录时即带回文件类型，无需对每个条目再做 stat
+        with os.scandir(input_dir) as entries:
+            csv_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".csv") and entry.is_file()
+            ]
         if csv_files:
             click.echo(f"\n📁 发现 {len(csv_files)} 个CSV文件:")
             for i, file in enumerate(csv_files, 1):
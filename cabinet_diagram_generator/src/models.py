@@ -4,6 +4,8 @@
 包含机柜部署图生成工具的核心数据模型类。
 """
 
+import weakref
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from enum import Enum
@@ -117,7 +119,7 @@ class Device:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConflictInfo:
     """冲突信息"""
     conflict_type: ConflictType
@@ -133,7 +135,7 @@ class ConflictInfo:
             return f"{self.conflict_type.value}: {self.device1.资产编号} - {self.description}"
 
 
-@dataclass
+@dataclass(frozen=True)
 class AdjustmentRecord:
     """调整记录"""
     device: Device
@@ -160,6 +162,9 @@ class Cabinet:
     可用起始U位: int = 3
     可用结束U位: int = 39
     
+    # 所属布局（弱引用），增删设备时通知其索引过期
+    _layout: Optional["weakref.ReferenceType[Layout]"] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """初始化后处理"""
         # 如果有设备列表，自动设置区域信息
@@ -167,6 +172,10 @@ class Cabinet:
             first_device = self.设备列表[0]
             self.区域 = first_device.区域
             self.子区 = first_device.子区
+        
+        # 占用状态按可用U位范围初始化，后续增删设备只做增量更新
+        if self.设备列表 or len(self.占用状态) != self.可用结束U位 - self.可用起始U位 + 1:
+            self._update_occupation_status()
     
     @property
     def full_id(self) -> str:
@@ -199,12 +208,14 @@ class Cabinet:
         
         if device not in self.设备列表:
             self.设备列表.append(device)
-            self._update_occupation_status()
+            self._mark_occupation(device, True)
             
             # 更新区域信息
             if not self.区域:
                 self.区域 = device.区域
                 self.子区 = device.子区
+            
+            self._notify_layout()
         
         return True
     
@@ -213,10 +224,21 @@ class Cabinet:
         for i, device in enumerate(self.设备列表):
             if device.资产编号 == device_id:
                 del self.设备列表[i]
-                self._update_occupation_status()
+                self._mark_occupation(device, False)
+                # 冲突布局中可能存在重叠设备，需重新标记与被移除设备范围相交的其他设备
+                for other in self.设备列表:
+                    if not (other.end_position < device.U位 or device.end_position < other.U位):
+                        self._mark_occupation(other, True)
+                self._notify_layout()
                 return True
         return False
     
+    def _notify_layout(self) -> None:
+        """通知所属布局重建索引"""
+        layout = self._layout() if self._layout is not None else None
+        if layout is not None:
+            layout._index_dirty = True
+    
     def get_device_by_id(self, device_id: str) -> Optional[Device]:
         """根据ID获取设备"""
         for device in self.设备列表:
@@ -307,8 +329,16 @@ class Cabinet:
         
         return conflicts
     
+    def _mark_occupation(self, device: Device, occupied: bool) -> None:
+        """仅更新单个设备覆盖范围内的占用状态，避免整柜重建"""
+        start_idx = device.U位 - self.可用起始U位
+        end_idx = start_idx + device.设备高度 - 1
+        
+        for i in range(max(0, start_idx), min(len(self.占用状态), end_idx + 1)):
+            self.占用状态[i] = occupied
+    
     def _update_occupation_status(self):
-        """更新占用状态"""
+        """根据设备列表完整重建占用状态（用于设备字段被外部修改后的校正）"""
         # 重置占用状态
         self.占用状态 = [False] * (self.可用结束U位 - self.可用起始U位 + 1)
         
@@ -343,6 +373,20 @@ class Layout:
     冲突列表: List[ConflictInfo] = field(default_factory=list)
     调整记录: List[AdjustmentRecord] = field(default_factory=list)
 
+    # 机房/区域/设备用途索引，查询时若已过期则整体重建。
+    # 机柜需经 add_cabinet / remove_cabinet 增删，设备需经 Cabinet.add_device / remove_device 增删，
+    # 直接修改机柜字典、设备列表或设备属性不会使索引过期
+    _by_room: Dict[str, List[Cabinet]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_area: Dict[str, List[Cabinet]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_purpose: Dict[str, List[Device]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _purpose_count: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+    _index_dirty: bool = field(default=True, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """初始化后处理"""
+        for cabinet in self.机柜字典.values():
+            cabinet._layout = weakref.ref(self)
+
     @property
     def total_cabinets(self) -> int:
         """机柜总数"""
@@ -356,23 +400,57 @@ class Layout:
     @property
     def rooms(self) -> List[str]:
         """获取所有机房列表"""
-        rooms = set()
-        for cabinet in self.机柜字典.values():
-            rooms.add(cabinet.机房)
-        return sorted(list(rooms))
+        self._ensure_index()
+        return sorted(self._by_room)
 
     @property
     def areas(self) -> List[str]:
         """获取所有区域列表"""
-        areas = set()
-        for cabinet in self.机柜字典.values():
-            if cabinet.区域:
-                areas.add(cabinet.区域)
-        return sorted(list(areas))
+        self._ensure_index()
+        return sorted(self._by_area)
 
     def add_cabinet(self, cabinet: Cabinet) -> None:
         """添加机柜"""
+        existing = self.机柜字典.get(cabinet.full_id)
+        if existing is not None and existing is not cabinet:
+            self._detach_cabinet(existing)
         self.机柜字典[cabinet.full_id] = cabinet
+        cabinet._layout = weakref.ref(self)
+        self._index_dirty = True
+
+    def remove_cabinet(self, cabinet_id: str) -> bool:
+        """移除机柜"""
+        cabinet = self.机柜字典.pop(cabinet_id, None)
+        if cabinet is None:
+            return False
+        self._detach_cabinet(cabinet)
+        self._index_dirty = True
+        return True
+
+    def _detach_cabinet(self, cabinet: Cabinet) -> None:
+        """解除机柜与本布局的关联"""
+        if cabinet._layout is not None and cabinet._layout() is self:
+            cabinet._layout = None
+
+    def _ensure_index(self) -> None:
+        """索引过期时按当前机柜重建，否则直接复用"""
+        if not self._index_dirty:
+            return
+
+        by_room: Dict[str, List[Cabinet]] = {}
+        by_area: Dict[str, List[Cabinet]] = {}
+        by_purpose: Dict[str, List[Device]] = {}
+        for cabinet in self.机柜字典.values():
+            by_room.setdefault(cabinet.机房, []).append(cabinet)
+            if cabinet.区域:
+                by_area.setdefault(cabinet.区域, []).append(cabinet)
+            for device in cabinet.设备列表:
+                by_purpose.setdefault(device.设备用途, []).append(device)
+        self._by_room = by_room
+        self._by_area = by_area
+        self._by_purpose = by_purpose
+        self._purpose_count = Counter({purpose: len(devices) for purpose, devices in by_purpose.items()})
+        self._index_dirty = False
 
     def get_cabinet(self, cabinet_id: str) -> Optional[Cabinet]:
         """获取机柜"""
@@ -380,18 +458,18 @@ class Layout:
 
     def get_cabinets_by_room(self, room: str) -> List[Cabinet]:
         """根据机房获取机柜列表"""
-        return [cabinet for cabinet in self.机柜字典.values() if cabinet.机房 == room]
+        self._ensure_index()
+        return list(self._by_room.get(room, ()))
 
     def get_cabinets_by_area(self, area: str) -> List[Cabinet]:
         """根据区域获取机柜列表"""
-        return [cabinet for cabinet in self.机柜字典.values() if cabinet.区域 == area]
+        self._ensure_index()
+        return list(self._by_area.get(area, ()))
 
     def get_devices_by_purpose(self, purpose: str) -> List[Device]:
         """根据用途获取所有设备"""
-        devices = []
-        for cabinet in self.机柜字典.values():
-            devices.extend(cabinet.get_devices_by_purpose(purpose))
-        return devices
+        self._ensure_index()
+        return list(self._by_purpose.get(purpose, ()))
 
     def get_utilization_summary(self) -> Dict[str, float]:
         """获取利用率摘要"""
@@ -407,7 +485,7 @@ class Layout:
 
         # 按机房统计
         for room in self.rooms:
-            cabinets = self.get_cabinets_by_room(room)
+            cabinets = self._by_room[room]
             room_total = sum(len(cabinet.占用状态) for cabinet in cabinets)
             room_used = sum(sum(cabinet.占用状态) for cabinet in cabinets)
             summary[f"{room}利用率"] = (room_used / room_total * 100) if room_total > 0 else 0.0
@@ -445,12 +523,8 @@ class Layout:
         }
 
         # 设备用途统计
-        purpose_count = {}
-        for cabinet in self.机柜字典.values():
-            for device in cabinet.设备列表:
-                purpose = device.设备用途
-                purpose_count[purpose] = purpose_count.get(purpose, 0) + 1
-        stats["设备用途统计"] = purpose_count
+        self._ensure_index()
+        stats["设备用途统计"] = dict(self._purpose_count)
 
         return stats
 
@@ -8,10 +8,18 @@ import re
 import os
 import sys
 from pathlib import Path
-from typing import Union, Optional, List, Dict, Any, Tuple
+from typing import TYPE_CHECKING, Union, Optional, List, Dict, Any, Tuple
 from datetime import datetime
-import pandas as pd
-from loguru import logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# 支持的设备清单文件扩展名
+SUPPORTED_CSV_EXTENSIONS = frozenset({".csv", ".txt"})
+
+# U位/设备高度中的数字部分（逐行解析时复用，避免重复编译）
+_DIGITS_PATTERN = re.compile(r'(\d+)')
 
 
 class CabinetDiagramException(Exception):
@@ -49,6 +57,9 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None,
         log_file: 日志文件路径
         log_format: 日志格式
     """
+    # 延迟导入，避免仅使用解析类工具函数时加载日志库
+    from loguru import logger
+
     # 移除默认处理器
     logger.remove()
     
@@ -115,7 +126,7 @@ def parse_u_position(u_str: str) -> int:
     u_str = str(u_str).strip().upper()
     
     # 使用正则表达式提取数字
-    match = re.search(r'(\d+)', u_str)
+    match = _DIGITS_PATTERN.search(u_str)
     if not match:
         raise DataValidationError(f"无法解析U位格式: {u_str}")
     
@@ -146,7 +157,7 @@ def parse_device_height(height_str: str) -> int:
     height_str = str(height_str).strip().upper()
     
     # 使用正则表达式提取数字
-    match = re.search(r'(\d+)', height_str)
+    match = _DIGITS_PATTERN.search(height_str)
     if not match:
         raise DataValidationError(f"无法解析设备高度格式: {height_str}")
     
@@ -178,7 +189,7 @@ def validate_csv_file(file_path: Union[str, Path]) -> bool:
     if not path_obj.is_file():
         raise FileFormatError(f"路径不是文件: {file_path}")
     
-    if not path_obj.suffix.lower() in ['.csv', '.txt']:
+    if path_obj.suffix.lower() not in SUPPORTED_CSV_EXTENSIONS:
         raise FileFormatError(f"文件格式不支持: {path_obj.suffix}")
     
     try:
@@ -196,7 +207,7 @@ def validate_csv_file(file_path: Union[str, Path]) -> bool:
     return True
 
 
-def detect_csv_format(df: pd.DataFrame) -> str:
+def detect_csv_format(df: "pd.DataFrame") -> str:
     """
     检测CSV文件格式（新格式或旧格式）
     
@@ -334,6 +345,9 @@ def generate_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+_FILE_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     格式化文件大小
@@ -347,13 +361,13 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    
-    return f"{size_bytes:.1f}{size_names[i]}"
+    if size_bytes < 0:
+        # 负数不做单位换算（与逐级相除的原实现一致）
+        i = 0
+    else:
+        # 直接由二进制位数确定量级（每 10 位对应一个 1024 进制单位），无需循环逐级相除
+        i = max(0, min((int(size_bytes).bit_length() - 1) // 10, len(_FILE_SIZE_UNITS) - 1))
+    return f"{size_bytes / (1 << (10 * i)):.1f}{_FILE_SIZE_UNITS[i]}"
 
 
 def validate_device_data(device_data: Dict[str, Any]) -> List[str]:
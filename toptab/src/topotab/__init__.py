@@ -5,12 +5,19 @@ from typing import Any
 
 __all__ = ["app", "convert_drawio_to_csv"]
 
+# 延迟导入的公开属性: 属性名 -> (模块名, 模块内属性名)
+_LAZY_ATTRS = {
+    "app": ("topotab.cli", "app"),
+    "convert_drawio_to_csv": ("topotab.convert", "convert_drawio_to_csv"),
+}
+
 
 def __getattr__(name: str) -> Any:
-    if name == "app":
-        module = import_module("topotab.cli")
-        return getattr(module, "app")
-    elif name == "convert_drawio_to_csv":
-        module = import_module("topotab.convert")
-        return getattr(module, "convert_drawio_to_csv")
-    raise AttributeError(name)
+    try:
+        module_name, attr_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(name) from None
+    value = getattr(import_module(module_name), attr_name)
+    # 缓存到模块命名空间，后续访问不再经过 __getattr__
+    globals()[name] = value
+    return value
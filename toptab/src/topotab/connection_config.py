@@ -1,13 +1,128 @@
 """连接关系配置管理器"""
 
+import copy
 import json
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Pattern, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _default_config() -> Dict[str, Any]:
+    """构建默认连接关系配置（配置文件缺失时使用），每次调用返回新的字典"""
+    return {
+        "version": "1.0",
+        "description": "默认网络拓扑连接关系元数据配置",
+        "connection_metadata": {
+            "source": {
+                "region": {
+                    "parent_region": {
+                        "name": "父区域",
+                        "csv_column": "源-父区域",
+                        "required": False,
+                        "default": ""
+                    },
+                    "region": {
+                        "name": "所属区域",
+                        "csv_column": "源-所属区域",
+                        "required": False,
+                        "default": ""
+                    }
+                },
+                "node": {
+                    "device_name": {
+                        "name": "设备名",
+                        "csv_column": "源-设备名",
+                        "required": True
+                    },
+                    "device_model": {
+                        "name": "设备型号",
+                        "csv_column": "源-设备型号",
+                        "required": False,
+                        "default": ""
+                    }
+                },
+                "port": {
+                    "physical_interface": {
+                        "name": "物理接口",
+                        "csv_column": "源-物理接口",
+                        "required": False,
+                        "default": ""
+                    }
+                }
+            },
+            "target": {
+                "region": {
+                    "parent_region": {
+                        "name": "父区域",
+                        "csv_column": "目标-父区域",
+                        "required": False,
+                        "default": ""
+                    },
+                    "region": {
+                        "name": "所属区域",
+                        "csv_column": "目标-所属区域",
+                        "required": False,
+                        "default": ""
+                    }
+                },
+                "node": {
+                    "device_name": {
+                        "name": "设备名",
+                        "csv_column": "目标-设备名",
+                        "required": True
+                    },
+                    "device_model": {
+                        "name": "设备型号",
+                        "csv_column": "目标-设备型号",
+                        "required": False,
+                        "default": ""
+                    }
+                },
+                "port": {
+                    "physical_interface": {
+                        "name": "物理接口",
+                        "csv_column": "目标-物理接口",
+                        "required": False,
+                        "default": ""
+                    }
+                }
+            },
+            "link": {
+                "usage": {
+                    "name": "互联用途",
+                    "csv_column": "互联用途",
+                    "required": False,
+                    "default": ""
+                }
+            }
+        },
+        "parsing_rules": {
+            "node_formats": [
+                {
+                    "name": "设备名_div_设备型号",
+                    "pattern": "^([^<]+)<div>([^<]+)</div>$",
+                    "fields": ["device_name", "device_model"],
+                    "priority": 1
+                }
+            ],
+            "port_keywords": {
+                "port_channel": ["port-channel", "portchannel", "pc号"],
+                "physical_interface": ["物理接口", "interface", "接口"]
+            }
+        },
+        "csv_output": {
+            "column_order": [
+                "源-设备名", "源-设备型号", "源-物理接口",
+                "互联用途",
+                "目标-物理接口", "目标-设备型号", "目标-设备名"
+            ]
+        }
+    }
+
+
 class ConnectionConfigManager:
     """连接关系配置管理器"""
     
@@ -26,10 +141,13 @@ class ConnectionConfigManager:
             self.config_path = Path(config_path)
         
         self.config: Optional[Dict[str, Any]] = None
+        self._compiled_node_formats: Optional[List[Tuple[Pattern[str], List[str]]]] = None
+        self._compiled_node_formats_source: Optional[List[Dict[str, Any]]] = None
         self._load_config()
     
     def _load_config(self) -> None:
         """加载配置文件"""
+        self._compiled_node_formats = None
         try:
             if not self.config_path.exists():
                 logger.warning(f"连接关系配置文件不存在: {self.config_path}")
@@ -47,115 +165,7 @@ class ConnectionConfigManager:
     
     def _create_default_config(self) -> None:
         """创建默认配置"""
-        self.config = {
-            "version": "1.0",
-            "description": "默认网络拓扑连接关系元数据配置",
-            "connection_metadata": {
-                "source": {
-                    "region": {
-                        "parent_region": {
-                            "name": "父区域",
-                            "csv_column": "源-父区域",
-                            "required": False,
-                            "default": ""
-                        },
-                        "region": {
-                            "name": "所属区域",
-                            "csv_column": "源-所属区域",
-                            "required": False,
-                            "default": ""
-                        }
-                    },
-                    "node": {
-                        "device_name": {
-                            "name": "设备名",
-                            "csv_column": "源-设备名",
-                            "required": True
-                        },
-                        "device_model": {
-                            "name": "设备型号",
-                            "csv_column": "源-设备型号",
-                            "required": False,
-                            "default": ""
-                        }
-                    },
-                    "port": {
-                        "physical_interface": {
-                            "name": "物理接口",
-                            "csv_column": "源-物理接口",
-                            "required": False,
-                            "default": ""
-                        }
-                    }
-                },
-                "target": {
-                    "region": {
-                        "parent_region": {
-                            "name": "父区域",
-                            "csv_column": "目标-父区域",
-                            "required": False,
-                            "default": ""
-                        },
-                        "region": {
-                            "name": "所属区域",
-                            "csv_column": "目标-所属区域",
-                            "required": False,
-                            "default": ""
-                        }
-                    },
-                    "node": {
-                        "device_name": {
-                            "name": "设备名",
-                            "csv_column": "目标-设备名",
-                            "required": True
-                        },
-                        "device_model": {
-                            "name": "设备型号",
-                            "csv_column": "目标-设备型号",
-                            "required": False,
-                            "default": ""
-                        }
-                    },
-                    "port": {
-                        "physical_interface": {
-                            "name": "物理接口",
-                            "csv_column": "目标-物理接口",
-                            "required": False,
-                            "default": ""
-                        }
-                    }
-                },
-                "link": {
-                    "usage": {
-                        "name": "互联用途",
-                        "csv_column": "互联用途",
-                        "required": False,
-                        "default": ""
-                    }
-                }
-            },
-            "parsing_rules": {
-                "node_formats": [
-                    {
-                        "name": "设备名_div_设备型号",
-                        "pattern": "^([^<]+)<div>([^<]+)</div>$",
-                        "fields": ["device_name", "device_model"],
-                        "priority": 1
-                    }
-                ],
-                "port_keywords": {
-                    "port_channel": ["port-channel", "portchannel", "pc号"],
-                    "physical_interface": ["物理接口", "interface", "接口"]
-                }
-            },
-            "csv_output": {
-                "column_order": [
-                    "源-设备名", "源-设备型号", "源-物理接口",
-                    "互联用途",
-                    "目标-物理接口", "目标-设备型号", "目标-设备名"
-                ]
-            }
-        }
+        self.config = _default_config()
         
         # 保存默认配置
         self.save_config()
@@ -166,8 +176,10 @@ class ConnectionConfigManager:
             # 确保配置目录存在
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            # 先整体序列化再一次写入，避免 json.dump 逐片段调用 write
+            self.config_path.write_text(
+                json.dumps(self.config, ensure_ascii=False, indent=2), encoding='utf-8'
+            )
             
             logger.info(f"成功保存连接关系配置文件: {self.config_path}")
             
@@ -194,6 +206,25 @@ class ConnectionConfigManager:
         """获取节点解析格式"""
         return self.get_parsing_rules().get('node_formats', [])
     
+    def get_compiled_node_formats(self) -> List[Tuple[Pattern[str], List[str]]]:
+        """获取按优先级排序、正则已预编译的节点解析格式"""
+        node_formats = self.get_node_formats()
+        # 配置可经 get_config() 修改，节点格式与编译时的快照不一致时重新编译
+        if self._compiled_node_formats is None or node_formats != self._compiled_node_formats_source:
+            compiled = []
+            for format_config in sorted(node_formats, key=lambda x: x.get('priority', 999)):
+                pattern = format_config.get('pattern', '')
+                fields = format_config.get('fields', [])
+                if not (pattern and fields):
+                    continue
+                try:
+                    compiled.append((re.compile(pattern), fields))
+                except re.error as e:
+                    logger.warning(f"节点解析格式正则无效，已跳过: {pattern} ({e})")
+            self._compiled_node_formats = compiled
+            self._compiled_node_formats_source = copy.deepcopy(node_formats)
+        return self._compiled_node_formats
+    
     def get_port_keywords(self) -> Dict[str, list[str]]:
         """获取端口关键词"""
         return self.get_parsing_rules().get('port_keywords', {})
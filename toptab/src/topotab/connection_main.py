@@ -9,8 +9,6 @@ from typing import Optional
 from .connection_config import ConnectionConfigManager
 from .connection_parser import ConnectionParser
 from .connection_csv import ConnectionCSVWriter
-from .universal_csv import UniversalCSVReader
-from .universal_drawio import UniversalDrawioWriter
 
 # 默认目录设置
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -146,6 +144,10 @@ def convert_csv_to_drawio(input_file: str,
         if not input_path.suffix.lower() == '.csv':
             logger.warning(f"输入文件不是.csv格式: {input_file}")
 
+        # 延迟导入：通用CSV读取依赖 pandas/chardet，仅在 CSV → draw.io 方向加载
+        from .universal_csv import UniversalCSVReader
+        from .universal_drawio import UniversalDrawioWriter
+
         # 初始化通用CSV读取器
         csv_reader = UniversalCSVReader()
 
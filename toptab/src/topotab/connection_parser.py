@@ -107,18 +107,13 @@ class ConnectionParser:
         clean_value = clean_value.replace('&nbsp;', ' ').replace('&lt;', '<').replace('&gt;', '>')
         
         # 尝试各种解析格式
-        node_formats = self.config_manager.get_node_formats()
-        for format_config in sorted(node_formats, key=lambda x: x.get('priority', 999)):
-            pattern = format_config.get('pattern', '')
-            fields = format_config.get('fields', [])
-            
-            if pattern and fields:
-                match = re.match(pattern, clean_value.strip())
-                if match:
-                    for i, field in enumerate(fields):
-                        if i < len(match.groups()):
-                            device_info[field] = match.group(i + 1).strip()
-                    break
+        for pattern, fields in self.config_manager.get_compiled_node_formats():
+            match = pattern.match(clean_value.strip())
+            if match:
+                for i, field in enumerate(fields):
+                    if i < len(match.groups()):
+                        device_info[field] = match.group(i + 1).strip()
+                break
         
         # 如果没有匹配到任何格式，使用原始值作为设备名
         if not device_info.get('device_name'):
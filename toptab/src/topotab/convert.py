@@ -11,6 +11,7 @@
 
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -20,6 +21,12 @@ from .schema import CsvSchema
 from .models import Link
 
 
+@lru_cache(maxsize=8)
+def _load_schema(template_path: str, mtime_ns: int) -> CsvSchema:
+    """按模板路径和修改时间缓存解析后的CSV模板，批量转换时避免重复解析"""
+    return CsvSchema.from_template(Path(template_path))
+
+
 def convert_drawio_to_csv(
     input_path: Path,
     output_path: Path,
@@ -78,15 +85,14 @@ def convert_drawio_to_csv(
     # 显示设备列表
     if verbose and topology.devices:
         print("\n识别的设备:")
-        for i, name in enumerate(topology.devices.keys(), 1):
-            print(f"  {i}. {name}")
+        print("\n".join(f"  {i}. {name}" for i, name in enumerate(topology.devices, 1)))
     
     # 过滤有效链路（非自连接）
     # 自连接的判断：设备名和管理地址都相同才算自连接
     # 如果管理地址不同，即使设备名相同也不算自连接（可能是同型号不同设备）
     valid_links = [link for link in topology.links
-                  if not (link.src.device_name == link.dst.device_name and
-                         link.src.management_address == link.dst.management_address)]
+                   if (link.src.device_name, link.src.management_address)
+                   != (link.dst.device_name, link.dst.management_address)]
     
     if verbose and len(valid_links) < len(topology.links):
         print(f"\n过滤了 {len(topology.links) - len(valid_links)} 条自连接")
@@ -99,7 +105,7 @@ def convert_drawio_to_csv(
         print(f"\n正在写入CSV文件: {output_path}")
         print(f"使用编码: {encoding}")
 
-    schema = CsvSchema.from_template(template_path)
+    schema = _load_schema(str(template_path), template_path.stat().st_mtime_ns)
     writer = CsvTopologyWriter(schema)
 
     if encoding == 'universal':
@@ -122,8 +128,10 @@ def convert_drawio_to_csv(
         
         if valid_links:
             print("\n前5条链路示例:")
-            for i, link in enumerate(valid_links[:5], 1):
-                print(f"  {i}. {link.src.device_name} -> {link.dst.device_name}")
+            print("\n".join(
+                f"  {i}. {link.src.device_name} -> {link.dst.device_name}"
+                for i, link in enumerate(valid_links[:5], 1)
+            ))
     
     return valid_links
 